@@ -1,28 +1,31 @@
 from fastapi import APIRouter, Body, status, HTTPException, Depends
 from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 
 from src.schemas.requests import Login
-from src.schemas.responses import ValidationErrorResponse, SuccessResponse, BadResponse
-from src.utils.token import JWTManager
+from src.schemas.responses import SuccessResponse, BadResponse
+from src.utils.token import jwt_manager
 from src.database.connection import DatabaseConnection
 from src.utils.logger import Logger
 from src.database.repository.passengers import PassengersRepository
+from src.utils.dependencies import get_db
+from src.utils.routing import ORJSONRoute
 
-router = APIRouter(prefix='/auth', tags=['Authentication'])
+router = APIRouter(prefix='/auth', tags=['Authentication'], route_class=ORJSONRoute)
+
+logger = Logger()
 
 @router.post('/login')
 def login(
-    credentials: dict = Body(
+    credentials: Login = Body(
         ...,
-        title='passengers Credentiales for login',
-        json_schema_extra=Login.schema()
+        title='passengers Credentiales for login'
         ),
+    db: DatabaseConnection = Depends(get_db)
     ):
     """
     Authenticates a user based on provided credentials.\n
     **Args:** \n
-        credentials (dict): A dictionary containing the user's login credentials.\n
+        credentials (Login): The user's login credentials, validated by FastAPI.\n
         db (Session): Database session dependency.\n
     **Returns:**\n
         - 200 OK: If the user is authenticated successfully, returns a token.\n
@@ -32,20 +35,8 @@ def login(
         - 500 Internal Server Error: If there is an error generating the token.\n
     """
 
-    logger = Logger()
     logger.log('INFO', f"[/api/v1/auth/login] [POST] Authenticating user with credentials {credentials}")
 
-    try:
-        credentials = Login(**credentials)
-    except ValidationError as e:
-        logger.log('ERROR', f"[/api/v1/auth/login] [POST] [400] Error validating request body")
-        errors_details = e.errors()
-
-        response = ValidationErrorResponse(details=errors_details)
-
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_400_BAD_REQUEST)
-
-    db = DatabaseConnection()
     customer_repository = PassengersRepository(db)
     customer = customer_repository.get_by_email(credentials.email)
 
@@ -53,25 +44,24 @@ def login(
         logger.log('ERROR', f"[/api/v1/auth/login] [POST] [401] User not found")
         
         response = BadResponse(message='Customer not found')
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_404_NOT_FOUND)
+        return JSONResponse(content=response.model_dump(exclude_none=True), status_code=status.HTTP_404_NOT_FOUND)
     else:
         if not customer["password"] == credentials.password:
             logger.log('ERROR', f"[/api/v1/auth/login] [POST] [401] Invalid password")
             
             response = BadResponse(message='Invalid password')
-            return JSONResponse(content=response.model_dump(), status_code=status.HTTP_401_UNAUTHORIZED)
+            return JSONResponse(content=response.model_dump(exclude_none=True), status_code=status.HTTP_401_UNAUTHORIZED)
         else:
             try:
-                token_manager = JWTManager()
-                token = token_manager.encode(credentials.model_dump())
+                token = jwt_manager.encode(credentials.model_dump())
             except Exception as e:
                 logger.log('ERROR', f"[/api/v1/auth/login] [POST] [500] Error generating token: {str(e)}")
                 
                 response = BadResponse(message='Possible error generating token')
-                return JSONResponse(content=response.model_dump(), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                return JSONResponse(content=response.model_dump(exclude_none=True), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
             http_response = SuccessResponse(data={'token': token})
 
             logger.log('INFO', f"[/api/v1/auth/login] [POST] [200] User authenticated successfully")
             
-            return JSONResponse(content=http_response.model_dump(), status_code=status.HTTP_200_OK) 
+            return JSONResponse(content=http_response.model_dump(exclude_none=True), status_code=status.HTTP_200_OK) 
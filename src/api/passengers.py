@@ -1,61 +1,85 @@
 from fastapi import APIRouter, Body, Depends, Header, Path, status, Query
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import ORJSONResponse, Response
+from functools import lru_cache
+from starlette.concurrency import run_in_threadpool
 from peewee import IntegrityError
-from pydantic import ValidationError
 
 from src.database.repository.passengers import PassengersRepository
 from src.database.connection import DatabaseConnection
 from src.utils.logger import Logger
-from src.schemas.responses import SuccessResponse, BadResponse, ValidationErrorResponse
+from src.schemas.responses import SuccessResponse, BadResponse, current_timestamp
 from src.schemas.requests import PassengerRequestSchema
-from src.utils.dependencies import JWTBearerDependencie
-from src.utils.token import JWTManager
+from src.utils.dependencies import JWTBearerDependencie, get_db
+from src.utils.token import jwt_manager
+from src.utils.routing import ORJSONRoute
 
 router = APIRouter(
     prefix='/passengers',
-    tags=['Passengers']
+    tags=['Passengers'],
+    route_class=ORJSONRoute
 )
 
+logger = Logger()
+
+PASSENGER_LIST_FIELDS = ['id', 'name', 'age', 'email', 'created_at', 'updated_at']
+
+@lru_cache(maxsize=1)
+def forbidden_response_body(timestamp: str) -> bytes:
+    """
+    Returns the serialized 403 payload for the given timestamp.
+    The message is constant, so the bytes are built once per second and reused.
+    """
+    response = BadResponse(message='passenger logged in does not have access to this resource', timestamp=timestamp)
+    return response.model_dump_json(exclude_none=True).encode()
+
 @router.get('/')
-def get_all_passengers():
+async def get_all_passengers(
+    skip: int = Query(0, ge=0, description='Number of passengers to skip'),
+    limit: int = Query(100, ge=1, le=1000, description='Maximum number of passengers to return'),
+    db: DatabaseConnection = Depends(get_db)
+    ):
     """
-    Retrieve all passengers from the database. \n
-    This endpoint retrieves all passengers from the database and paginates the results 
-    using the FastAPI pagination extension. \n
+    Retrieve passengers from the database. \n
+    This endpoint retrieves a page of passengers from the database ordered by ID, \n
+    the pagination is resolved by the database with OFFSET/LIMIT. \n
 
     **Arguments** \n
+        - skip (int): Number of passengers to skip. \n
+        - limit (int): Maximum number of passengers to return, up to 1000. \n
         - db (Session): Database session dependency, provided by FastAPI's Depends. \n
     **Responses** \n
-        - 200: A paginated list of passengers (. \n
+        - 200: A page of passengers under `items`, and `next_offset` to request the next page (null on the last page). \n
     **Logs Levels** \n
         - INFO: Logs the start of the passenger retrieval process. \n
         - INFO: Logs the successful completion of the passenger retrieval process. \n
     """
-    logger = Logger()
-    
     logger.log('INFO', f"[/api/v1/passengers/] [GET] Retreiving passengers from database")
 
-    db = DatabaseConnection()
-
     passenger_repo = PassengersRepository(db)
 
-    passengers = passenger_repo.get_passengers()
+    passengers = await run_in_threadpool(passenger_repo.get_passengers, skip, limit, PASSENGER_LIST_FIELDS)
 
-    json_response = SuccessResponse(data=passengers).model_dump()
+    next_offset = skip + limit if len(passengers) == limit else None
+
+    json_response = SuccessResponse(data={
+        'items': passengers,
+        'next_offset': next_offset
+    }).model_dump_json(exclude_none=True)
 
     logger.log('INFO', f"[/api/v1/passengers/] [GET] [200] Passengers retreived successfully")
 
-    return JSONResponse(content=json_response, status_code=status.HTTP_200_OK)
+    return Response(content=json_response, media_type='application/json', status_code=status.HTTP_200_OK)
 
 
 @router.get('/{id}')
-def get_passenger_details(
+async def get_passenger_details(
     decoded_token: str = Depends(JWTBearerDependencie()),
     id: int = Path(
         ...,
         title='passengers ID',
         description='Unique identity value for a passengers'
-        )
+        ),
+    db: DatabaseConnection = Depends(get_db)
     ):
     """
     Retrieve passenger details by ID.\n
@@ -65,52 +89,37 @@ def get_passenger_details(
     
     **Responses:** \n
         - 200: passenger details retrieved successfully.\n
-        - 403: Forbidden access to passenger with the provided ID.\n
-        - 404: passenger with the provided ID not found.\n
+        - 403: Forbidden access to passenger with the provided ID, or passenger not found.\n
     **Log Levels:**\n
         - INFO:\n
             - Retrieving passenger with ID from database.\n
             - passenger with ID retrieved successfully.\n
         - ERROR:\n
-            - passenger with ID not found.\n
             - Forbidden access to passenger with ID.\n
     """
-    logger = Logger()
-    
     logger.log('INFO',f"[/api/v1/passengers/{id}] [GET] Retreiving passenger with ID {id} from database")
 
-    db = DatabaseConnection()
-
     passengers_repo = PassengersRepository(db)
     
-    passenger = passengers_repo.get_by_email(decoded_token['email'])
+    passenger = await run_in_threadpool(passengers_repo.get_if_owner, id, decoded_token['email'], PASSENGER_LIST_FIELDS)
 
     if not passenger:
         
-        logger.log('ERROR', f"[/api/v1/passengers/{id}] [GET] [404] passenger with ID {id} not found")
-        
-        response = BadResponse(message='passenger not found')
-        
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_404_NOT_FOUND)
+        logger.log('ERROR', f"[/api/v1/passengers/{id}] [GET] [403] Forbidden access to passenger with ID {id}")
+
+        return Response(content=forbidden_response_body(current_timestamp()), media_type='application/json', status_code=status.HTTP_403_FORBIDDEN)
     else:
-        if passenger['id'] != id:
-            
-            logger.log('ERROR', f"[/api/v1/passengers/{id}] [GET] [403] Forbidden access to passenger with ID {id}")
+        http_response = SuccessResponse(data=passenger).model_dump_json(exclude_none=True)
 
-            response = BadResponse(message='passenger logged in does not have access to this resource')
-            
-            return JSONResponse(content=response.model_dump(), status_code=status.HTTP_403_FORBIDDEN)
-        else:
-            http_response = SuccessResponse(data=passenger).model_dump()
+        logger.log('INFO', f"[/api/v1/passengers/{id}] [GET] [200] passenger with ID {id} retreived successfully")
 
-            logger.log('INFO', f"[/api/v1/passengers/{id}] [GET] [200] passenger with ID {id} retreived successfully")
-    
-            return JSONResponse(content=http_response, status_code=status.HTTP_200_OK)
+        return Response(content=http_response, media_type='application/json', status_code=status.HTTP_200_OK)
         
 
 @router.post('/')
-def create_passenger(
-    request: dict = Body(...,json_schema_extra=PassengerRequestSchema.schema())
+async def create_passenger(
+    body: PassengerRequestSchema = Body(...),
+    db: DatabaseConnection = Depends(get_db)
     ):
     """
     Create a new passenger in the database. \n
@@ -119,49 +128,32 @@ def create_passenger(
     
     **Args:** \n
         - db (Session): Database session dependency. \n
-        - request (dict): Request body containing passenger data.\n
+        - body (PassengerRequestSchema): Request body containing passenger data, validated by FastAPI.\n
     **Returns:** \n
         - JSONResponse: A JSON response with the status of the operation and relevant data or error messages. \n
     **Raises:** \n
-        - ValidationError: If the request body validation fails. \n
+        - RequestValidationError: If the request body validation fails, answered with a 400. \n
         - IntegrityError: If there is a database integrity error (e.g., passenger already exists). \n
         - Exception: If there is an error generating the JWT token.
     """
     
-    logger = Logger()
-    
     logger.log('INFO', f"[/api/v1/passengers/] [POST] Persisting passenger to database")
 
-    try: 
-        body = PassengerRequestSchema(**request)
-    except ValidationError as e:
-        logger.log('ERROR', f"[/api/v1/passengers/] [POST] [400] Error validating request body")
-
-        errors_details = e.errors()
-        
-        error_response = ValidationErrorResponse(details=errors_details)
-        
-        return JSONResponse(content=error_response.model_dump(), status_code=status.HTTP_400_BAD_REQUEST)
-    
-    db = DatabaseConnection()
-
     try:
         body_to_dict = body.model_dump()
 
         passenger_repository = PassengersRepository(db)
     
-        new_passenger_id = passenger_repository.create(body_to_dict)
+        new_passenger_id = await run_in_threadpool(passenger_repository.create, body_to_dict)
     except IntegrityError as e:
         
         logger.log('ERROR', f"[/api/v1/passengers/] [POST] [400] Error creating passenger: {str(e)}")
         
         response = BadResponse(message='passenger already exists')
         
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_400_BAD_REQUEST)
+        return ORJSONResponse(content=response.model_dump(exclude_none=True), status_code=status.HTTP_400_BAD_REQUEST)
     
     try:
-        jwt_manager = JWTManager()
-        
         token = jwt_manager.encode(body_to_dict)
     except Exception as e:
         
@@ -169,7 +161,7 @@ def create_passenger(
         
         response = BadResponse(message='Possible error generating token')
         
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return ORJSONResponse(content=response.model_dump(exclude_none=True), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     http_response = SuccessResponse(data={
         'passenger': {"id": new_passenger_id, **body_to_dict},
@@ -178,14 +170,15 @@ def create_passenger(
 
     logger.log('INFO', "[/api/v1/passengers/] [POST] [201] passenger created successfully")
     
-    return JSONResponse(content=http_response.model_dump(), status_code=status.HTTP_201_CREATED)
+    return Response(content=http_response.model_dump_json(exclude_none=True), media_type='application/json', status_code=status.HTTP_201_CREATED)
 
 
 @router.put('/{id}')
-def update_passenger(
+async def update_passenger(
     decoded_token: dict = Depends(JWTBearerDependencie()), 
     id: int = Path(..., title='passenger ID', description='Unique identity value for a passenger'),
-    request: dict = Body(..., json_schema_extra=PassengerRequestSchema.model_json_schema())
+    body: PassengerRequestSchema = Body(...),
+    db: DatabaseConnection = Depends(get_db)
     ):
     """
     Update a passenger in the database.\n
@@ -196,93 +189,64 @@ def update_passenger(
         - db (Session): Database session dependency.\n
         - decoded_token (dict): Decoded JWT token dependency.\n
         - id (int): Unique identity value for a passenger.\n
-        - request (dict): Request body containing the passenger data to update.\n
+        - body (PassengerRequestSchema): Request body containing the passenger data to update, validated by FastAPI.\n
     **Returns:**\n
         - JSONResponse: JSON response with the status of the operation and any relevant data or error messages.\n
     **Raises:**\n
-        - ValidationError: If the request body validation fails.\n
+        - RequestValidationError: If the request body validation fails, answered with a 400.\n
         - Exception: If there is an error generating the JWT token.\n
     **Logs:**\n
         - INFO: Logs the start and successful completion of the update operation.\n
         - ERROR: Logs any errors encountered during the process.\n
     **Responses:**\n
         - 400: Bad request if the request body validation fails.\n
-        - 404: Not found if the passenger with the specified ID does not exist.\n
-        - 403: Forbidden if the logged-in passenger does not have access to the specified resource.\n
+        - 403: Forbidden if the logged-in passenger does not have access to the specified resource or it does not exist.\n
         - 500: Internal server error if there is an error generating the JWT token.\n
         - 201: Created if the passenger is updated successfully.\n
     """
     
-    logger = Logger()
-    
     logger.log('INFO', f"[/api/v1/passengers/{id}] [PUT] Replacing passenger with ID {id} from database")
 
-    try:  
-        body = PassengerRequestSchema(**request)
-    except ValidationError as e:
-        
-        logger.log('ERRO', f"[/api/v1/passengers/{id}] [PUT] [400] Error validating request body")
-
-        errors_details = e.errors()
-        
-        error_response = ValidationErrorResponse(details=errors_details)
-        
-        return JSONResponse(content=error_response.model_dump(), status_code=status.HTTP_400_BAD_REQUEST)
-
-
-    db = DatabaseConnection()
-
     passenger_repository = PassengersRepository(db)
 
-    passenger = passenger_repository.get_by_email(decoded_token['email'])
+    passenger = await run_in_threadpool(passenger_repository.get_if_owner, id, decoded_token['email'], ['id'])
 
     body_to_dict = body.model_dump()
 
     if not passenger:
         
-        logger.log('ERROR', f"[/api/v1/passengers/{id}] [PUT] [404] passenger with ID {id} not found")
-        
-        response = BadResponse(message='passenger not found')
-        
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_404_NOT_FOUND)
+        logger.log('ERROR', f"[/api/v1/passengers/{id}] [PUT] [403] Forbidden access to passenger with ID {id}")
+
+        return Response(content=forbidden_response_body(current_timestamp()), media_type='application/json', status_code=status.HTTP_403_FORBIDDEN)
     else:
-        if passenger["id"] != id:
-            
-            logger.log('ERROR', f"[/api/v1/passengers/{id}] [PUT] [403] Forbidden access to passenger with ID {id}")
 
-            response = BadResponse(message='passenger logged in does not have access to this resource')
+        updated_passenger = await run_in_threadpool(passenger_repository.update, id, body_to_dict)
 
-            return JSONResponse(content=response.model_dump(), status_code=status.HTTP_403_FORBIDDEN)
-        else:
-    
-            updated_passenger = passenger_repository.update(id, body_to_dict)
-
-            logger.log('INFO', f"[/api/v1/passengers/{id}] [PUT] [201] passenger with ID {id} updated successfully")
-
-            try:
-                jwt_manager = JWTManager()
-                
-                token = jwt_manager.encode(body_to_dict)
-            except Exception as e:
-                
-                logger.log('ERROR', f"[/api/v1/passengers/{id}] [PUT] [500] Error generating token: {str(e)}")
-                
-                response = BadResponse(message='Possible error generating token')
-                
-                return JSONResponse(content=response.model_dump(), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        logger.log('INFO', f"[/api/v1/passengers/{id}] [PUT] [201] passenger with ID {id} updated successfully")
+
+        try:
+            token = jwt_manager.encode(body_to_dict)
+        except Exception as e:
             
-            response = SuccessResponse(data={
-                'token': token,
-                'passenger': body_to_dict
-                }
-            )
-            return JSONResponse(content=response.model_dump(), status_code=status.HTTP_201_CREATED)
+            logger.log('ERROR', f"[/api/v1/passengers/{id}] [PUT] [500] Error generating token: {str(e)}")
+            
+            response = BadResponse(message='Possible error generating token')
+            
+            return ORJSONResponse(content=response.model_dump(exclude_none=True), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        response = SuccessResponse(data={
+            'token': token,
+            'passenger': body_to_dict
+            }
+        )
+        return Response(content=response.model_dump_json(exclude_none=True), media_type='application/json', status_code=status.HTTP_201_CREATED)
         
 
 @router.delete('/{id}')
-def delete_passenger(
+async def delete_passenger(
     decoded_token: dict = Depends(JWTBearerDependencie()),
-    id: int = Path(...,title='passenger ID',description='Unique identity value for a passenger')
+    id: int = Path(...,title='passenger ID',description='Unique identity value for a passenger'),
+    db: DatabaseConnection = Depends(get_db)
     ):
     """
     Deletes a passenger from the database.\n
@@ -296,85 +260,52 @@ def delete_passenger(
         - db (Session): The database session dependency.\n
         - id (int): The unique identity value for a passenger.\n
     **Returns:**\n
-        - 404 Not Found: If the passenger with the given ID does not exist.\n
-        - 403 Forbidden: If the logged-in passenger does not have access to delete the specified passenger.\n
+        - 403 Forbidden: If the logged-in passenger does not have access to delete the specified passenger or it does not exist.\n
         - 204 No Content: If the passenger is successfully deleted.\n
     **Logs:**\n
         - INFO: When attempting to delete a passenger.\n
-        - ERROR: If the passenger with the given ID does not exist.\n
         - ERROR: If the logged-in passenger does not have access to delete the specified passenger.\n
         - INFO: If the passenger is successfully deleted.\n
     """
     
-    logger = Logger()
-    
     logger.log('INFO', f"[/api/v1/passengers/{id}] [DELETE] Deleting passenger with ID {id} from database")
 
-    db = DatabaseConnection()
-
     passenger_repository = PassengersRepository(db)
 
-    passenger = passenger_repository.get_by_email(decoded_token['email'])
+    passenger = await run_in_threadpool(passenger_repository.get_if_owner, id, decoded_token['email'], ['id'])
 
     if not passenger:
         
-        logger.log('ERROR', f"[/api/v1/passengers/{id}] [DELETE] [404] passenger with ID {id} not found")
-        
-        response = BadResponse(message='passenger not found')
-        
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_404_NOT_FOUND)
-    else:
-        if passenger["id"] != id:
-            
-            logger.log('ERROR', f"[/api/v1/passengers/{id}] [DELETE] [403] Forbidden access to passenger with ID {id}")
-
-            response = BadResponse(message='passenger logged in does not have access to this resource')
+        logger.log('ERROR', f"[/api/v1/passengers/{id}] [DELETE] [403] Forbidden access to passenger with ID {id}")
 
-            return JSONResponse(content=response.model_dump(), status_code=status.HTTP_403_FORBIDDEN)
-        else:
-            logger.log('INFO', f"[/api/v1/passengers/{id}] [DELETE] [204] passenger with ID {id} deleted successfully")
-
-            passenger_repository.delete(id)
+        return Response(content=forbidden_response_body(current_timestamp()), media_type='application/json', status_code=status.HTTP_403_FORBIDDEN)
+    else:
+        logger.log('INFO', f"[/api/v1/passengers/{id}] [DELETE] [204] passenger with ID {id} deleted successfully")
 
-            response = SuccessResponse()
+        await run_in_threadpool(passenger_repository.delete, id)
 
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get('/{id}/reservations')
-def get_passenger_reservations(
+async def get_passenger_reservations(
     id: int = Path(...,title='passenger ID',description='Unique identity value for a passenger'),
     decoded_token: dict = Depends(JWTBearerDependencie()),
+    db: DatabaseConnection = Depends(get_db)
 ):
-    logger = Logger()
-
-    db = DatabaseConnection()
-
     passengers_repository = PassengersRepository(db)
 
-    passenger = passengers_repository.get_by_email(decoded_token['email'])
+    passenger = await run_in_threadpool(passengers_repository.get_if_owner, id, decoded_token['email'], ['id'])
 
     if not passenger:
         
-        logger.log('ERROR', f"[/api/v1/passengers/{id}] [DELETE] [404] passenger with ID {id} not found")
-        
-        response = BadResponse(message='passenger not found')
-        
-        return JSONResponse(content=response.model_dump(), status_code=status.HTTP_404_NOT_FOUND)
-    else:
-        if passenger["id"] != id:
-            
-            logger.log('ERROR', f"[/api/v1/passengers/{id}] [DELETE] [403] Forbidden access to passenger with ID {id}")
+        logger.log('ERROR', f"[/api/v1/passengers/{id}/reservations] [GET] [403] Forbidden access to passenger with ID {id}")
 
-            response = BadResponse(message='passenger logged in does not have access to this resource')
-
-            return JSONResponse(content=response.model_dump(), status_code=status.HTTP_403_FORBIDDEN)
-        else:
-
-            reservations = passengers_repository.get_reservations(id)
+        return Response(content=forbidden_response_body(current_timestamp()), media_type='application/json', status_code=status.HTTP_403_FORBIDDEN)
+    else:
 
-            db.close()
+        reservations = await run_in_threadpool(passengers_repository.get_reservations, id)
 
-            json_response = SuccessResponse(data=reservations).model_dump()
+        json_response = SuccessResponse(data=reservations).model_dump_json(exclude_none=True)
 
-            return JSONResponse(content=json_response, status_code=status.HTTP_200_OK)
+        return Response(content=json_response, media_type='application/json', status_code=status.HTTP_200_OK)
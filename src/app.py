@@ -1,13 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 
 from src.api.router import router
 from src.database.connection import DatabaseConnection
 from src.database.models.reservations import ReservationsModel
 from src.database.models.passengers import PassengersModel
+from src.schemas.responses import ValidationErrorResponse
 from src.utils.config import Config
+from src.utils.logger import Logger
 
 settings = Config()
 
+logger = Logger()
+
 app: FastAPI = FastAPI(
     title=settings.app_name,
     description='',
@@ -15,11 +21,29 @@ app: FastAPI = FastAPI(
     docs_url='/docs',
     redoc_url='/redoc',
     openapi_url='/openapi.json',
+    default_response_class=ORJSONResponse,
 )
 
 @app.on_event('startup')
 async def startup_event():
     database = DatabaseConnection().get_db()
-    database.create_tables([PassengersModel, ReservationsModel], **{"safe": True})
+    with database.connection_context():
+        database.create_tables([PassengersModel, ReservationsModel], **{"safe": True})
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    errors = exc.errors()
+
+    locations = ', '.join(sorted({str(error['loc'][0]) for error in errors}))
+
+    logger.log('ERROR', f"[{request.url.path}] [{request.method}] [400] Error validating request {locations}")
+
+    errors_details = [
+        {**error, 'loc': error['loc'][1:] or error['loc']} for error in errors
+    ]
+
+    response = ValidationErrorResponse(details=errors_details)
+
+    return ORJSONResponse(content=response.model_dump(), status_code=status.HTTP_400_BAD_REQUEST)
 
 app.include_router(router)
@@ -1,17 +1,44 @@
-from peewee import PostgresqlDatabase, Model
+from peewee import PostgresqlDatabase, Model, _ConnectionState
+from playhouse.pool import PooledPostgresqlDatabase
+from contextvars import ContextVar
 
 from src.utils.config import Config
 
 settings = Config()
 
+MAX_CONNECTIONS = 20
+
+db_state_default = {'closed': None, 'conn': None, 'ctx': None, 'transactions': None}
+db_state = ContextVar('db_state', default=db_state_default.copy())
+
+class PeeweeConnectionState(_ConnectionState):
+    """
+    Peewee connection state stored in a context variable instead of a thread local.
+    This lets async request handlers share the same pooled connection with the
+    repository calls they offload to the threadpool.
+    """
+    def __init__(self, **kwargs):
+        super().__setattr__('_state', db_state)
+        super().__init__(**kwargs)
+
+    def __setattr__(self, name, value):
+        self._state.get()[name] = value
+
+    def __getattr__(self, name):
+        return self._state.get()[name]
+
 class DatabaseConnection:
     """
     Singleton class to manage the database connection.
     This class ensures that only one instance of the database connection exists
-    throughout the application. It uses the PostgreSQL database and retrieves
-    connection settings from a settings module.
+    throughout the application. It uses a pooled PostgreSQL database, so
+    connect()/close() check connections out of and back into the pool (waiting up to
+    10 seconds for a free connection when it is exhausted), and retrieves connection
+    settings from a settings module.
     Methods
     -------
+    reset_state():
+        Starts a fresh connection state for the current request context.
     connect():
         Opens the database connection if it is closed.
     close():
@@ -28,7 +55,10 @@ class DatabaseConnection:
         return cls._instance
 
     def _initialize_connection(self):
-        self.db = PostgresqlDatabase(
+        self.db = PooledPostgresqlDatabase(
+            max_connections=MAX_CONNECTIONS,
+            stale_timeout=300,
+            timeout=10,
             **{
                 'database': settings.database_name,
                 'user': settings.database_user,
@@ -37,6 +67,11 @@ class DatabaseConnection:
                 'port': settings.database_port
             }
         )
+        self.db._state = PeeweeConnectionState()
+
+    def reset_state(self):
+        db_state.set(db_state_default.copy())
+        self.db._state.reset()
 
     def connect(self):
         if self.db.is_closed():
@@ -11,6 +11,8 @@ class PassengersModel(PostgresqlModel):
         name (CharField): The name of the passenger. This is a required field with a maximum length of 255 characters.
         age (IntegerField): The age of the passenger. This is a required field.
         email (CharField): The email address of the passenger. This is a required field with a maximum length of 255 characters.
+            It is unique, so peewee creates a unique B-tree index on it that serves the login and ownership lookups.
+        password (CharField): The password of the passenger. This is a required field with a maximum length of 36 characters.
         created_at (DateTimeField): The timestamp indicating when the passenger record was created. 
             Defaults to the current date and time in ISO 8601 format with minute precision.
         updated_at (DateTimeField): The timestamp indicating when the passenger record was last updated. 
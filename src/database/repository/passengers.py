@@ -1,4 +1,5 @@
 from src.database.models.passengers import PassengersModel
+from src.database.models.reservations import ReservationsModel
 from src.database.connection import PostgresqlDatabase
 
 from datetime import datetime
@@ -14,11 +15,12 @@ class PassengersRepository:
         model (PassengersModel): The model representing the passengers table.
 
     Methods:
-        get_passengers(skip: int = 0, limit: int = 100):
-            Retrieves a list of passengers from the database with pagination.
+        get_passengers(skip: int = 0, limit: int = 100, fields: list = None):
+            Retrieves a list of passengers from the database with pagination, ordered by ID.
             Args:
                 skip (int): The number of records to skip. Default is 0.
                 limit (int): The maximum number of records to return. Default is 100.
+                fields (list): Names of the columns to select. Default is None, which selects every column.
             Returns:
                 list: A list of passenger records.
 
@@ -28,13 +30,23 @@ class PassengersRepository:
                 passenger_id (int): The ID of the passenger to retrieve.
             Returns:
                 dict: A dictionary representing the passenger record, or None if not found.
+
+        get_if_owner(id: int, passenger_email: str, fields: list = None):
+            Retrieves a passenger record only if it belongs to the given email.
+            Args:
+                id (int): The ID of the passenger to retrieve.
+                passenger_email (str): The email of the authenticated passenger.
+                fields (list): Names of the columns to select. Default is None, which selects every column.
+            Returns:
+                dict: A dictionary representing the passenger record, or None if not found or not owned.
     """
     def __init__(self, db: PostgresqlDatabase):
         self.db = db
         self.model = PassengersModel
 
-    def get_passengers(self):
-        result = self.model.select().dicts()
+    def get_passengers(self, skip: int = 0, limit: int = 100, fields: list = None):
+        columns = [getattr(self.model, field) for field in fields] if fields else []
+        result = self.model.select(*columns).order_by(self.model.id).offset(skip).limit(limit).dicts()
         return list(result)
 
     def get_passenger_by_id(self, passenger_id: int):
@@ -47,14 +59,26 @@ class PassengersRepository:
     
     def get_by_email(self, passenger_email: str):
         try:
-            return self.model.select().where(self.model.email == passenger_email).dicts().get()
+            return self.model.select(
+                self.model.id,
+                self.model.email,
+                self.model.password
+            ).where(self.model.email == passenger_email).dicts().get()
+        except DoesNotExist as e:
+            return None
+
+    def get_if_owner(self, id: int, passenger_email: str, fields: list = None):
+        columns = [getattr(self.model, field) for field in fields] if fields else []
+        try:
+            return self.model.select(*columns).where(
+                (self.model.id == id) & (self.model.email == passenger_email)
+            ).dicts().get()
         except DoesNotExist as e:
             return None
 
     def create(self, data: dict):
         result = self.model.create(**data)
-        print(result)
-        return result
+        return result.id
     
 
     def update(self, id: int, data: dict):
@@ -74,9 +98,6 @@ class PassengersRepository:
 
         return True
     
-    def get_reservations(self, id: str):
-        passenger = self.model.get(self.model.id == id)
-        
-        reservations = passenger.reservations.dicts()
-
-        return list(reservations)
+    def get_reservations(self, id: int):
+        result = ReservationsModel.select().where(ReservationsModel.passenger_id == id).dicts()
+        return list(result)
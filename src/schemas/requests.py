@@ -21,12 +21,12 @@ class Login(BaseModel):
             Raises:
                 ValueError: If the email address format is invalid.
     """
-    email: EmailStr = Field(..., example='user@example.com', description='Email address of a customer', examples="email@example.com")
-    password: PasswordStr = Field(..., description='Customer password', examples="Password123!")
+    email: EmailStr = Field(..., example='user@example.com', description='Email address of a customer', examples=["email@example.com"])
+    password: PasswordStr = Field(..., description='Customer password', examples=["Password123!"])
 
 
 class ReservationRequestSchema(BaseModel):
-    scheduled_at: str = Field(datetime.now().isoformat(timespec='minutes'), title="Date of reservation", description="The date of the reservation in the format YYYY-MM-DD")
+    scheduled_at: str = Field(default_factory=lambda: datetime.now().isoformat(timespec='minutes'), title="Date of reservation", description="The date of the reservation in the format YYYY-MM-DD")
     destination: str = Field(..., title="Destination", description="The destination of the reservation")
 
 
@@ -35,7 +35,7 @@ class PassengerIdRequestSchema(BaseModel):
 
 
 class PassengerRequestSchema(BaseModel):
-    name: AlphaStr = Field(..., title="Name for the passenger", examples="Jonh")
-    age: int = Field(..., title="Age for the passenger", examples=18)
-    email: EmailStr = Field(..., title="Email for the passenger", examples="user@example.com")
-    password: PasswordStr = Field(..., title="Password for the passenger", examples="Password123!")
+    name: AlphaStr = Field(..., title="Name for the passenger", examples=["Jonh"])
+    age: int = Field(..., title="Age for the passenger", examples=[18])
+    email: EmailStr = Field(..., title="Email for the passenger", examples=["user@example.com"])
+    password: PasswordStr = Field(..., title="Password for the passenger", examples=["Password123!"])
@@ -1,24 +1,35 @@
-from pydantic import BaseModel, field_validator, Field
+from pydantic import BaseModel, ConfigDict, field_validator, Field
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Union
+import time
+
+
+@lru_cache(maxsize=1)
+def _timestamp_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def current_timestamp() -> str:
+    """
+    Returns the current time in ISO format with one second granularity.
+    The formatted value is cached, so responses built within the same second reuse it.
+    """
+    return _timestamp_for_second(int(time.time()))
+
 
 class ValidationErrorResponse(BaseModel):
     status: Optional[str] = Field('error', example='error')
     details: List[Dict[str, str]] = Field(..., example=[])
     error_type: Optional[str] = Field('ValidationError', example="ValidationError")
-    timestamp: Optional[str] = Field(datetime.now().isoformat(), example="2021-01-01T00:00:00")
+    timestamp: Optional[str] = Field(default_factory=current_timestamp, example="2021-01-01T00:00:00")
 
     @field_validator('details', mode='before')
     def construct_details(cls, value):
-        details = []
-        for error in value:
-            details.append(
-                {
-                    'field': error['loc'][0],
-                    'message': error['msg']
-                }
-            )
-        return details
+        return [
+            {'field': '.'.join(map(str, error['loc'])), 'message': error['msg']}
+            for error in value
+        ]
 
 class HttpResponse(BaseModel):
     """
@@ -29,9 +40,11 @@ class HttpResponse(BaseModel):
         message (Optional[str]): A message describing the result of the operation. Defaults to 'Operation successful'.
         timestamp (Optional[str]): The timestamp when the response is generated. Defaults to the current time in ISO format.
     """
+    model_config = ConfigDict(ser_json_timedelta='iso8601')
+
     success: Optional[bool] = Field(True, example=True)
     message: Optional[str] = Field('Operation successful', example='Operation successful')
-    timestamp: Optional[str] = Field(datetime.now().isoformat(), example="2021-01-01T00:00:00")
+    timestamp: Optional[str] = Field(default_factory=current_timestamp, example="2021-01-01T00:00:00")
 
 class SuccessResponse(HttpResponse):
     data: Optional[Union[list, dict]]= Field({}, example={})
@@ -39,5 +52,5 @@ class SuccessResponse(HttpResponse):
 class BadResponse(HttpResponse):
     message: Optional[str] = Field('Operation failed', example='Operation failed')
     success: Optional[bool] = Field(False, example=False)
-    detail: Optional[Union[list, dict]]= Field({}, example={})
+    detail: Optional[Union[list, dict]]= Field(None, example={})
     
\ No newline at end of file
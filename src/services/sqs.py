@@ -1,17 +1,40 @@
 from boto3 import client
-import time
+from typing import Callable, List
 
 from src.utils.config import Config
 
 settings = Config()
 
+_SQS_CLIENT = client('sqs', region_name=settings.queue_region)
+
 class SQSService:
     def __init__(self):
-        self.client = client('sqs')
+        self.client = _SQS_CLIENT
 
-    def receive_messages(self):
+    def receive_messages(self, process_messages: Callable[[List[dict]], None]):
+        """
+        Long-polls the queue and processes the received messages in batches.
+        Args:
+            process_messages (Callable): Function that receives the list of messages of each batch.
+        """
         while True:
             response = self.client.receive_message(
-                QueueUrl=settings.queue_url
+                QueueUrl=settings.queue_url,
+                WaitTimeSeconds=20,
+                MaxNumberOfMessages=10
+            )
+
+            messages = response.get('Messages', [])
+
+            if not messages:
+                continue
+
+            process_messages(messages)
+
+            self.client.delete_message_batch(
+                QueueUrl=settings.queue_url,
+                Entries=[
+                    {'Id': message['MessageId'], 'ReceiptHandle': message['ReceiptHandle']}
+                    for message in messages
+                ]
             )
-            time.sleep(1)
@@ -1,7 +1,23 @@
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from cachetools import TTLCache
+from datetime import datetime, timezone
+import asyncio
+import hashlib
 
-from src.utils.token import JWTManager
+from src.utils.token import jwt_manager
+from src.utils.config import Config
+from src.database.connection import DatabaseConnection, MAX_CONNECTIONS
+
+settings = Config()
+
+pool_slots = asyncio.Semaphore(MAX_CONNECTIONS)
+
+decoded_tokens_cache = TTLCache(
+    maxsize=10_000,
+    ttl=min(30, settings.token_expiration_in_minutes * 60)
+)
 
 
 class JWTBearerDependencie(HTTPBearer):
@@ -13,6 +29,7 @@ class JWTBearerDependencie(HTTPBearer):
         Initializes the JWTBearerDependencie with an optional auto_error parameter.
     __call__(self, req: Request):
         Asynchronously processes the incoming request to extract and decode the JWT token.
+        Already verified tokens carrying an exp claim are served from a short-lived cache keyed by the token hash.
         Raises an HTTPException with status code 401 if the token is invalid or decoding fails.
     Parameters:
     -----------
@@ -30,9 +47,43 @@ class JWTBearerDependencie(HTTPBearer):
     async def __call__(self, req: Request):
         credentials: HTTPAuthorizationCredentials = await super(JWTBearerDependencie, self).__call__(req)
         
+        token = credentials.credentials
+        key = hashlib.sha256(token.encode()).digest()
+
+        decoded_token = decoded_tokens_cache.get(key)
+
+        if decoded_token is not None and decoded_token.get('exp', 0) > datetime.now(tz=timezone.utc).timestamp():
+            return decoded_token
+
         try:
-            decoded_token = JWTManager().decode(credentials.credentials)
+            decoded_token = jwt_manager.decode(token)
         except ValueError as error:
+            decoded_tokens_cache.pop(key, None)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={'error': error.__str__()})
+
+        if 'exp' in decoded_token:
+            decoded_tokens_cache[key] = decoded_token
     
         return decoded_token
+
+
+async def get_db():
+    """
+    Dependency that yields the shared pooled database connection.
+    The request gets its own connection state and a connection checked out of the pool,
+    which is returned once the response has been produced. Requests wait for a free pool
+    slot on the event loop, and checkout and release run in the threadpool, so neither a
+    cold connect nor an exhausted pool blocks the event loop or starves the worker threads.
+    Yields:
+    -------
+    db : DatabaseConnection
+        The singleton database connection.
+    """
+    db = DatabaseConnection()
+    db.reset_state()
+    async with pool_slots:
+        await run_in_threadpool(db.connect)
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
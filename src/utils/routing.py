@@ -0,0 +1,32 @@
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+import orjson
+
+
+class ORJSONRequest(Request):
+    """
+    Request that parses its JSON body with orjson instead of the stdlib json module.
+    """
+
+    async def json(self):
+        if not hasattr(self, '_json'):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    APIRoute that hands ORJSONRequest instances to the endpoint, so request bodies
+    are decoded with orjson before FastAPI validates them.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
@@ -96,3 +96,5 @@ class JWTManager(TokenBaseManager):
             raise ValueError("Invalid token")
         
         return decoded_token
+
+jwt_manager = JWTManager()
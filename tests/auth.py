@@ -1,8 +1,13 @@
 import pytest
+import hashlib
+import jwt
+from datetime import datetime, timezone, timedelta
 from fastapi.testclient import TestClient
 from faker import Faker
 
 from main import app
+from src.utils.config import Config
+from src.utils.dependencies import decoded_tokens_cache
 
 def test_login():
     client = TestClient(app)
@@ -51,3 +56,91 @@ def test_login():
     })
 
     assert response.status_code == 204
+
+
+def test_token_cache():
+    client = TestClient(app)
+    faker = Faker()
+    settings = Config()
+
+    request_payload = {
+        'name': 'John',
+        'age': 25,
+        'email': faker.email(),
+        'password': 'Asdfghjk1'
+    }
+
+    response = client.post('/api/v1/passengers/', json=request_payload)
+
+    assert response.status_code == 201
+
+    passenger_id = response.json()['data']['passenger']['id']
+    token = response.json()['data']['token']
+    key = hashlib.sha256(token.encode()).digest()
+
+    # Miss: the token is verified and cached
+    response = client.get(f'/api/v1/passengers/{passenger_id}', headers={
+        'Authorization': f'Bearer {token}'
+    })
+
+    assert response.status_code == 200
+    assert key in decoded_tokens_cache
+
+    # Hit: the cached payload is used without decoding the token again
+    cached_token = decoded_tokens_cache[key]
+    decoded_tokens_cache[key] = {**cached_token, 'email': faker.email()}
+
+    response = client.get(f'/api/v1/passengers/{passenger_id}', headers={
+        'Authorization': f'Bearer {token}'
+    })
+
+    assert response.status_code == 403
+
+    decoded_tokens_cache[key] = cached_token
+
+    # Expired cached entry: the token is decoded again and rejected
+    expiration = datetime.now(tz=timezone.utc) - timedelta(minutes=1)
+    expired_token = jwt.encode(
+        {**request_payload, 'exp': expiration},
+        key=settings.token_secret_key,
+        algorithm=settings.token_algorithm
+    )
+    expired_key = hashlib.sha256(expired_token.encode()).digest()
+    decoded_tokens_cache[expired_key] = {**request_payload, 'exp': expiration.timestamp()}
+
+    response = client.get(f'/api/v1/passengers/{passenger_id}', headers={
+        'Authorization': f'Bearer {expired_token}'
+    })
+
+    assert response.status_code == 401
+    assert expired_key not in decoded_tokens_cache
+
+    # Invalid token: rejected and never cached
+    response = client.get(f'/api/v1/passengers/{passenger_id}', headers={
+        'Authorization': 'Bearer invalid.token.value'
+    })
+
+    assert response.status_code == 401
+    assert hashlib.sha256(b'invalid.token.value').digest() not in decoded_tokens_cache
+
+    # Token without exp: accepted on every request but never cached
+    no_exp_token = jwt.encode(
+        request_payload,
+        key=settings.token_secret_key,
+        algorithm=settings.token_algorithm
+    )
+
+    for _ in range(2):
+        response = client.get(f'/api/v1/passengers/{passenger_id}', headers={
+            'Authorization': f'Bearer {no_exp_token}'
+        })
+
+        assert response.status_code == 200
+
+    assert hashlib.sha256(no_exp_token.encode()).digest() not in decoded_tokens_cache
+
+    response = client.delete(f'/api/v1/passengers/{passenger_id}', headers={
+        'Authorization': f'Bearer {token}'
+    })
+
+    assert response.status_code == 204
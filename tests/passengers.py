@@ -41,6 +41,37 @@ def test_passenger_endpoints():
     passenger_email = response.json()['data']['passenger']['email']
     token = response.json()['data']['token']
 
+    # Test list passengers
+    response = client.get('/api/v1/passengers/', params={'limit': 1})
+
+    assert response.status_code == 200
+    assert len(response.json()['data']['items']) == 1
+    assert response.json()['data']['next_offset'] == 1
+    assert 'password' not in response.json()['data']['items'][0]
+
+    passenger_ids = []
+    next_offset = 0
+
+    while next_offset is not None:
+        response = client.get('/api/v1/passengers/', params={'skip': next_offset, 'limit': 1000})
+
+        assert response.status_code == 200
+
+        page = response.json()['data']
+        passenger_ids.extend(passenger['id'] for passenger in page['items'])
+        next_offset = page['next_offset']
+
+    assert len(page['items']) < 1000
+    assert passenger_id in passenger_ids
+
+    response = client.get('/api/v1/passengers/', params={'limit': 0})
+
+    assert response.status_code == 400
+
+    response = client.get('/api/v1/passengers/', params={'limit': 1001})
+
+    assert response.status_code == 400
+
     
     # Test get passenger by id
     response = client.get('/api/v1/passengers/6456482840', headers={
@@ -57,6 +88,7 @@ def test_passenger_endpoints():
     assert response.status_code == 200
     assert response.json()['success'] == True
     assert response.json()['data']['id'] == passenger_id
+    assert 'password' not in response.json()['data']
 
     # Test update passenger
 